@@ -1,17 +1,44 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, Body, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import httpx
 
 from .enrichment import Enricher
 from .adapter import normalize_telemetry
 
-app = FastAPI(title="HPCSim Enrichment API", version="0.1.0")
+# Shared client for forwarding to the next stage, so every lap reuses
+# a pooled keep-alive connection (created on first use)
+_callback_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_callback_client() -> httpx.AsyncClient:
+    global _callback_client
+    if _callback_client is None:
+        _callback_client = httpx.AsyncClient(timeout=5.0)
+    return _callback_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _callback_client
+    yield
+    if _callback_client is not None:
+        await _callback_client.aclose()
+        _callback_client = None
+
+
+app = FastAPI(
+    title="HPCSim Enrichment API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Single Enricher instance keeps state across laps
 _enricher = Enricher()
@@ -57,13 +84,12 @@ async def ingest_telemetry(payload: Dict[str, Any] = Body(...)):
     # Send both enriched telemetry and race context
     if _CALLBACK_URL:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                await client.post(_CALLBACK_URL, json=result)
+            await _get_callback_client().post(_CALLBACK_URL, json=result)
         except Exception:
             # Don't fail ingestion if forwarding fails; log could be added here
             pass
 
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.post("/enriched")
@@ -73,13 +99,13 @@ async def post_enriched(enriched: EnrichedRecord):
     _recent.append(rec)
     if len(_recent) > _MAX_RECENT:
         del _recent[: len(_recent) - _MAX_RECENT]
-    return JSONResponse(rec)
+    return ORJSONResponse(rec)
 
 
 @app.get("/enriched")
 async def list_enriched(limit: int = 50):
     limit = max(1, min(200, limit))
-    return JSONResponse(_recent[-limit:])
+    return ORJSONResponse(_recent[-limit:])
 
 
 @app.get("/healthz")
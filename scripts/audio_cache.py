@@ -0,0 +1,78 @@
+"""
+On-disk cache of synthesized voice clips, keyed by content hash.
+
+Shared by the Pi simulator's announcer and RaceEngineerVoice, so both use
+the same keys and the same safe write path.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+# Anchored to the repo root, so the location does not depend on the working directory
+CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "audio_cache"
+
+# Least recently used clips are evicted once the cache grows past this
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+
+def cache_key(voice_id: str, model_id: str, voice_settings: Dict[str, Any], text: str) -> str:
+    """Content hash of everything that affects the synthesized audio."""
+    settings = json.dumps(voice_settings, sort_keys=True)
+    return hashlib.sha256(f"{voice_id}|{model_id}|{settings}|{text}".encode()).hexdigest()
+
+
+def cached_clip(key: str) -> Optional[Path]:
+    """Path of an already-synthesized clip for this key, if any (marked as recently used)."""
+    path = CACHE_DIR / f"{key}.mp3"
+    try:
+        os.utime(path)
+    except OSError:
+        return None
+    return path
+
+
+def write_clip(key: str, chunks: Iterable[bytes], on_chunk: Optional[Callable[[bytes], None]] = None) -> Path:
+    """
+    Write audio chunks as they arrive and return the cached clip's path.
+
+    Chunks go to a uniquely named scratch file in the cache dir that is renamed
+    into place once complete, so concurrent writers never share a file and
+    lookups never see a partial clip. The scratch file is removed on failure.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{key}.mp3"
+    f = tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix=".part", delete=False)
+    try:
+        with f:
+            for chunk in chunks:
+                f.write(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+        os.replace(f.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(f.name)
+        raise
+    evict()
+    return path
+
+
+def evict(max_bytes: int = MAX_CACHE_BYTES):
+    """Delete least recently used clips until the cache fits in max_bytes."""
+    clips = []
+    for path in CACHE_DIR.glob("*.mp3"):
+        with contextlib.suppress(OSError):
+            st = path.stat()
+            clips.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in clips)
+    for _, size, path in sorted(clips):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(OSError):
+            path.unlink()
+        total -= size
@@ -67,8 +67,13 @@ def extract_driver_telemetry(session: fastf1.core.Session, driver: str) -> pd.Da
     # Get telemetry for all laps
     telemetry_data = []
     
-    for lap_num in driver_laps['LapNumber'].unique():
-        lap = driver_laps[driver_laps['LapNumber'] == lap_num].iloc[0]
+    # First row of each lap, found in one vectorized pass instead of
+    # rescanning the whole frame per lap number
+    first_of_lap = ~driver_laps['LapNumber'].duplicated().to_numpy()
+    
+    for pos in np.flatnonzero(first_of_lap):
+        lap = driver_laps.iloc[pos]
+        lap_num = lap['LapNumber']
         
         try:
             telemetry = lap.get_telemetry()
@@ -173,8 +178,8 @@ def prepare_telemetry_stream(telemetry: pd.DataFrame, sample_rate_hz: float = 10
     print(f"Preparing telemetry stream at {sample_rate_hz} Hz...")
     
     # Resample to target rate if needed
-    telemetry = telemetry.copy()
-    telemetry['Time'] = pd.to_timedelta(telemetry['Time'])
+    # assign() + sort_values() leave the caller's frame untouched, so no extra .copy()
+    telemetry = telemetry.assign(Time=pd.to_timedelta(telemetry['Time']))
     telemetry = telemetry.sort_values(['LapNumber', 'Time'])
     
     # Convert to milliseconds for easier time tracking
@@ -13,4 +13,5 @@ import uvicorn
 
 
 if __name__ == "__main__":
-    uvicorn.run("hpcsim.api:app", host="0.0.0.0", port=8000, reload=False)
+    # Hold idle keep-alive connections across the simulator's lap interval
+    uvicorn.run("hpcsim.api:app", host="0.0.0.0", port=8000, reload=False, timeout_keep_alive=90)
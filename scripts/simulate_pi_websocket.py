@@ -15,33 +15,63 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import contextlib
+import importlib.util
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 import sys
 import os
-from datetime import datetime
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    import pandas as pd
+    import aiohttp
+    import orjson
     import websockets
     from websockets.client import WebSocketClientProtocol
 except ImportError:
     print("Error: Required packages not installed.")
-    print("Run: pip install pandas websockets")
+    print("Run: pip install aiohttp orjson pandas websockets")
     sys.exit(1)
 
-# Optional voice support
-try:
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs import save
-    from dotenv import load_dotenv
-    # Load .env from root directory (default behavior)
-    load_dotenv()
-    VOICE_AVAILABLE = True
-except ImportError:
-    VOICE_AVAILABLE = False
+# pandas is only needed once the CSV is loaded; check for it here but
+# import lazily in load_lap_csv so --help and early failures start fast
+if importlib.util.find_spec("pandas") is None:
+    print("Error: Required packages not installed.")
+    print("Run: pip install aiohttp orjson pandas websockets")
+    sys.exit(1)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# orjson encodes to bytes; WebSocket frames and bodies are sent as str
+def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+_loads = orjson.loads
+
+
+# Fixed frame, serialized once
+_DISCONNECT_FRAME = _dumps({"type": "disconnect"})
+
+# Raw lap bodies are serialized up front, so posts carry the content type themselves
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Synthesized clips are shared with voice_service.py through one on-disk cache
+from audio_cache import cache_key, cached_clip, write_clip
+
+# Optional voice support (imported in VoiceAnnouncer only when voice is enabled)
+VOICE_AVAILABLE = (
+    importlib.util.find_spec("elevenlabs") is not None
+    and importlib.util.find_spec("dotenv") is not None
+)
+if not VOICE_AVAILABLE:
     print("Note: elevenlabs not installed. Voice features disabled.")
     print("To enable voice: pip install elevenlabs python-dotenv")
 
@@ -52,20 +82,105 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Column types for the lap CSV so pandas skips per-column type inference.
+# position/gaps are read as float because they may be missing (NaN) for
+# some laps; load_lap_csv fills them before casting.
+_LAP_CSV_DTYPES = {
+    "lap_number": "int32",
+    "total_laps": "int32",
+    "position": "float64",
+    "gap_to_leader": "float64",
+    "gap_to_ahead": "float64",
+    "lap_time": "object",
+    "average_speed": "float64",
+    "max_speed": "float64",
+    "tire_compound": "category",
+    "tire_life_laps": "int32",
+    "track_temperature": "float64",
+    "rainfall": "bool",
+}
+
+
+def _brake_bias_message(brake_bias: int) -> str:
+    """Race engineer phrasing for a brake bias setting."""
+    if brake_bias < 4:
+        return f"Brake bias set to {brake_bias}, forward biased for sharper turn in response"
+    elif brake_bias == 4:
+        return f"Brake bias {brake_bias}, slightly forward to help rotation"
+    elif brake_bias > 6:
+        return f"Brake bias set to {brake_bias}, rearward to protect front tire wear"
+    elif brake_bias == 6:
+        return f"Brake bias {brake_bias}, slightly rear for front tire management"
+    return f"Brake bias neutral at {brake_bias}"
+
+
+def _diff_slip_message(diff_slip: int) -> str:
+    """Race engineer phrasing for a differential slip setting."""
+    if diff_slip < 4:
+        return f"Differential at {diff_slip}, tightened for better rotation through corners"
+    elif diff_slip == 4:
+        return f"Differential {diff_slip}, slightly tight for rotation"
+    elif diff_slip > 6:
+        return f"Differential set to {diff_slip}, loosened to reduce rear tire degradation"
+    elif diff_slip == 6:
+        return f"Differential {diff_slip}, slightly loose for tire preservation"
+    return f"Differential neutral at {diff_slip}"
+
+
+# Controls are integers on a 0-10 scale, so every phrase can be built up front
+_BRAKE_BIAS_MESSAGES = [_brake_bias_message(i) for i in range(11)]
+_DIFF_SLIP_MESSAGES = [_diff_slip_message(i) for i in range(11)]
+
+
+def _control_message(table: List[str], build, value: int) -> str:
+    """Prebuilt phrase for an in-range setting, built on the fly otherwise."""
+    if isinstance(value, int) and 0 <= value < len(table):
+        return table[value]
+    return build(value)
+
+
+# Text up to the first period (or the whole string if there is none)
+_FIRST_SENTENCE_RE = re.compile(r"[^.]*")
+
 
 class VoiceAnnouncer:
     """ElevenLabs text-to-speech announcer for race engineer communications."""
     
+    # Flash is ElevenLabs' low-latency model
+    _MODEL_ID = "eleven_flash_v2_5"
+    _VOICE_SETTINGS = {
+        "stability": 0.4,
+        "similarity_boost": 0.95,
+        "style": 0.7,
+        "use_speaker_boost": True
+    }
+    
     def __init__(self, enabled: bool = True):
         """Initialize ElevenLabs voice engine if available."""
         self.enabled = enabled and VOICE_AVAILABLE
         self.client = None
-        self.audio_dir = Path("data/audio")
-        # Use exact same voice as voice_service.py
+        # Use exact same voice and settings as voice_service.py
         self.voice_id = "mbBupyLcEivjpxh8Brkf"  # Rachel voice
+        self.model_id = self._MODEL_ID
+        self.voice_settings = self._VOICE_SETTINGS
+        # Audio players, resolved once: one for cached files, one that reads MP3 on stdin
+        self._player_cmd = self._find_file_player()
+        self._pipe_player = self._find_pipe_player()
+        # One TTS/playback worker; messages are played one at a time
+        self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        # Message being played (None when idle) and the newest one waiting behind it
+        self._current_message: Optional[str] = None
+        self._next_message: Optional[str] = None
+        # Last message actually played, so an identical repeat is not re-announced
+        self._last_message: Optional[str] = None
         
         if self.enabled:
             try:
+                from elevenlabs.client import ElevenLabs
+                from dotenv import load_dotenv
+                # Load .env from root directory (default behavior)
+                load_dotenv()
+                
                 api_key = os.getenv("ELEVENLABS_API_KEY")
                 if not api_key:
                     logger.warning("⚠ ELEVENLABS_API_KEY not found in environment")
@@ -73,12 +188,31 @@ class VoiceAnnouncer:
                     return
                 
                 self.client = ElevenLabs(api_key=api_key)
-                self.audio_dir.mkdir(parents=True, exist_ok=True)
                 logger.info("✓ Voice announcer initialized (ElevenLabs)")
             except Exception as e:
                 logger.warning(f"⚠ Voice engine initialization failed: {e}")
                 self.enabled = False
     
+    @staticmethod
+    def _find_file_player() -> Optional[List[str]]:
+        """Command line (without the file argument) for playing an MP3 file."""
+        if sys.platform == "darwin":
+            return ["afplay"]
+        if shutil.which("mpg123"):
+            return ["mpg123", "-q"]
+        if shutil.which("ffplay"):
+            return ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet"]
+        return None
+    
+    @staticmethod
+    def _find_pipe_player() -> Optional[List[str]]:
+        """Command line for a player that can read an MP3 stream from stdin."""
+        if shutil.which("mpg123"):
+            return ["mpg123", "-q", "-"]
+        if shutil.which("ffplay"):
+            return ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "pipe:0"]
+        return None
+    
     def _format_strategy_message(self, data: Dict[str, Any]) -> str:
         """
         Format strategy update into natural race engineer speech.
@@ -111,44 +245,21 @@ class VoiceAnnouncer:
             else:
                 parts.append(f"Running {clean_strategy} strategy.")
         
-        # Control adjustments with specific values
-        control_messages = []
-        
-        # Brake bias announcement with context
-        if brake_bias < 4:
-            control_messages.append(f"Brake bias set to {brake_bias}, forward biased for sharper turn in response")
-        elif brake_bias == 4:
-            control_messages.append(f"Brake bias {brake_bias}, slightly forward to help rotation")
-        elif brake_bias > 6:
-            control_messages.append(f"Brake bias set to {brake_bias}, rearward to protect front tire wear")
-        elif brake_bias == 6:
-            control_messages.append(f"Brake bias {brake_bias}, slightly rear for front tire management")
-        else:
-            control_messages.append(f"Brake bias neutral at {brake_bias}")
-        
-        # Differential slip announcement with context
-        if diff_slip < 4:
-            control_messages.append(f"Differential at {diff_slip}, tightened for better rotation through corners")
-        elif diff_slip == 4:
-            control_messages.append(f"Differential {diff_slip}, slightly tight for rotation")
-        elif diff_slip > 6:
-            control_messages.append(f"Differential set to {diff_slip}, loosened to reduce rear tire degradation")
-        elif diff_slip == 6:
-            control_messages.append(f"Differential {diff_slip}, slightly loose for tire preservation")
-        else:
-            control_messages.append(f"Differential neutral at {diff_slip}")
+        # Control adjustments with specific values (prebuilt per setting 0-10)
+        control_messages = [
+            _control_message(_BRAKE_BIAS_MESSAGES, _brake_bias_message, brake_bias),
+            _control_message(_DIFF_SLIP_MESSAGES, _diff_slip_message, diff_slip),
+        ]
         
         if control_messages:
             parts.append(". ".join(control_messages) + ".")
         
         # Key reasoning excerpt (first sentence only)
         if reasoning:
-            # Extract first meaningful sentence
-            sentences = reasoning.split('.')
-            if sentences:
-                key_reason = sentences[0].strip()
-                if len(key_reason) > 20 and len(key_reason) < 150:  # Slightly longer for more context
-                    parts.append(key_reason + ".")
+            # Extract first meaningful sentence without splitting the rest
+            key_reason = _FIRST_SENTENCE_RE.match(reasoning).group().strip()
+            if len(key_reason) > 20 and len(key_reason) < 150:  # Slightly longer for more context
+                parts.append(key_reason + ".")
         
         return " ".join(parts)
     
@@ -176,6 +287,136 @@ class VoiceAnnouncer:
         
         return f"Lap {lap}. Controls adjusted."
     
+    def _cache_key(self, message: str) -> str:
+        """Key of the message's clip in the shared audio cache."""
+        return cache_key(self.voice_id, self.model_id, self.voice_settings, message)
+    
+    def _synthesize_to_path(self, message: str) -> Path:
+        """
+        Get an MP3 of the message, calling ElevenLabs only on a cache miss.
+        
+        Args:
+            message: Text to speak
+            
+        Returns:
+            Path to the cached audio file
+        """
+        key = self._cache_key(message)
+        audio_path = cached_clip(key)
+        if audio_path is None:
+            audio = self.client.text_to_speech.convert(
+                voice_id=self.voice_id,
+                text=message,
+                model_id=self.model_id,
+                voice_settings=self.voice_settings
+            )
+            audio_path = write_clip(key, audio)
+            logger.info(f"[VOICE] Saved to {audio_path}")
+        return audio_path
+    
+    def _stream_to_player(self, message: str, key: str):
+        """
+        Stream synthesis straight into the player, filling the cache as it goes.
+        
+        Playback starts on the first chunk instead of after the whole clip
+        has been generated and saved.
+        """
+        chunks = self.client.text_to_speech.stream(
+            voice_id=self.voice_id,
+            text=message,
+            model_id=self.model_id,
+            voice_settings=self.voice_settings
+        )
+        player = subprocess.Popen(self._pipe_player, stdin=subprocess.PIPE)
+        player_alive = True
+        
+        def feed_player(chunk):
+            nonlocal player_alive
+            if player_alive:
+                try:
+                    player.stdin.write(chunk)
+                except OSError:
+                    # Player exited early; keep filling the cache
+                    player_alive = False
+        
+        try:
+            audio_path = write_clip(key, chunks, on_chunk=feed_player)
+        finally:
+            try:
+                player.stdin.close()
+            except OSError:
+                pass
+            player.wait()
+        logger.info(f"[VOICE] Saved to {audio_path}")
+    
+    def _prepare_audio(self, message: str) -> Optional[Path]:
+        """
+        Make the message playable, synthesizing it only if it is not cached yet.
+        
+        Returns:
+            Path to play, or None if the audio was already played while streaming
+        """
+        key = self._cache_key(message)
+        audio_path = cached_clip(key)
+        if audio_path is not None:
+            logger.info(f"[VOICE] Reusing cached audio {audio_path}")
+            return audio_path
+        if self._pipe_player:
+            self._stream_to_player(message, key)
+            return None
+        return self._synthesize_to_path(message)
+    
+    async def _play(self, audio_path: Path):
+        """Play an audio file without a shell and without holding a worker thread."""
+        if self._player_cmd is None:
+            if sys.platform == "win32":
+                os.startfile(audio_path)
+            return
+        proc = await asyncio.create_subprocess_exec(
+            *self._player_cmd, str(audio_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        await proc.wait()
+    
+    async def _synthesize_and_play(self, message: str):
+        """Synthesize on the TTS thread (ElevenLabs client is blocking), then play."""
+        loop = asyncio.get_running_loop()
+        try:
+            audio_path = await loop.run_in_executor(self._tts_executor, self._prepare_audio, message)
+            if audio_path is not None:
+                await self._play(audio_path)
+            self._last_message = message
+        except Exception as e:
+            logger.error(f"[VOICE] Synthesis error: {e}")
+    
+    async def _announce(self, message: str):
+        """
+        Synthesize (or fetch from cache) and play a message off the event loop.
+        
+        While a clip is playing, the newest message waits in a single slot and
+        plays as soon as the clip finishes; an older message still waiting there
+        is stale and gets replaced.
+        """
+        if message in (self._last_message, self._current_message, self._next_message):
+            logger.info(f"[VOICE] Identical to a recent announcement, skipping: {message}")
+            return
+        
+        if self._current_message is not None:
+            if self._next_message is not None:
+                logger.info(f"[VOICE] Dropping stale queued announcement: {self._next_message}")
+            self._next_message = message
+            return
+        
+        try:
+            while message is not None:
+                self._current_message = message
+                logger.info(f"[VOICE] Announcing: {message}")
+                await self._synthesize_and_play(message)
+                message, self._next_message = self._next_message, None
+        finally:
+            self._current_message = None
+    
     async def announce_strategy(self, data: Dict[str, Any]):
         """
         Announce strategy update with ElevenLabs voice synthesis.
@@ -187,55 +428,7 @@ class VoiceAnnouncer:
             return
         
         try:
-            # Format message
-            message = self._format_strategy_message(data)
-            
-            logger.info(f"[VOICE] Announcing: {message}")
-            
-            # Generate unique audio filename
-            lap = data.get('lap', 0)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_path = self.audio_dir / f"lap_{lap}_{timestamp}.mp3"
-            
-            # Synthesize with ElevenLabs (exact same settings as voice_service.py)
-            def synthesize():
-                try:
-                    audio = self.client.text_to_speech.convert(
-                        voice_id=self.voice_id,
-                        text=message,
-                        model_id="eleven_multilingual_v2",  # Fast, low-latency model
-                        voice_settings={
-                            "stability": 0.4,
-                            "similarity_boost": 0.95,
-                            "style": 0.7,
-                            "use_speaker_boost": True
-                        }
-                    )
-                    save(audio, str(audio_path))
-                    logger.info(f"[VOICE] Saved to {audio_path}")
-                    
-                    # Play the audio
-                    if sys.platform == "darwin":  # macOS
-                        os.system(f"afplay {audio_path}")
-                    elif sys.platform == "linux":
-                        os.system(f"mpg123 {audio_path} || ffplay -nodisp -autoexit {audio_path}")
-                    elif sys.platform == "win32":
-                        os.system(f"start {audio_path}")
-                    
-                    # Clean up audio file after playing
-                    try:
-                        if audio_path.exists():
-                            audio_path.unlink()
-                            logger.info(f"[VOICE] Cleaned up {audio_path}")
-                    except Exception as cleanup_error:
-                        logger.warning(f"[VOICE] Failed to delete audio file: {cleanup_error}")
-                except Exception as e:
-                    logger.error(f"[VOICE] Synthesis error: {e}")
-            
-            # Run in separate thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, synthesize)
-            
+            await self._announce(self._format_strategy_message(data))
         except Exception as e:
             logger.error(f"[VOICE] Announcement failed: {e}")
     
@@ -250,55 +443,7 @@ class VoiceAnnouncer:
             return
         
         try:
-            # Format message
-            message = self._format_control_message(data)
-            
-            logger.info(f"[VOICE] Announcing: {message}")
-            
-            # Generate unique audio filename
-            lap = data.get('lap', 0)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_path = self.audio_dir / f"lap_{lap}_control_{timestamp}.mp3"
-            
-            # Synthesize with ElevenLabs (exact same settings as voice_service.py)
-            def synthesize():
-                try:
-                    audio = self.client.text_to_speech.convert(
-                        voice_id=self.voice_id,
-                        text=message,
-                        model_id="eleven_multilingual_v2",  # Fast, low-latency model
-                        voice_settings={
-                            "stability": 0.4,
-                            "similarity_boost": 0.95,
-                            "style": 0.7,
-                            "use_speaker_boost": True
-                        }
-                    )
-                    save(audio, str(audio_path))
-                    logger.info(f"[VOICE] Saved to {audio_path}")
-                    
-                    # Play the audio
-                    if sys.platform == "darwin":  # macOS
-                        os.system(f"afplay {audio_path}")
-                    elif sys.platform == "linux":
-                        os.system(f"mpg123 {audio_path} || ffplay -nodisp -autoexit {audio_path}")
-                    elif sys.platform == "win32":
-                        os.system(f"start {audio_path}")
-                    
-                    # Clean up audio file after playing
-                    try:
-                        if audio_path.exists():
-                            audio_path.unlink()
-                            logger.info(f"[VOICE] Cleaned up {audio_path}")
-                    except Exception as cleanup_error:
-                        logger.warning(f"[VOICE] Failed to delete audio file: {cleanup_error}")
-                except Exception as e:
-                    logger.error(f"[VOICE] Synthesis error: {e}")
-            
-            # Run in separate thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, synthesize)
-            
+            await self._announce(self._format_control_message(data))
         except Exception as e:
             logger.error(f"[VOICE] Announcement failed: {e}")
 
@@ -312,154 +457,156 @@ class PiSimulator:
         self.enrichment_url = enrichment_url
         self.interval = interval
         self.df: Optional[pd.DataFrame] = None
-        self.current_controls = {
-            "brake_bias": 5,
-            "differential_slip": 5
-        }
-        self.previous_controls = {
-            "brake_bias": 5,
-            "differential_slip": 5
-        }
+        # Current and previous control settings, kept as plain ints
+        self.brake_bias = self.diff_slip = 5
+        self.prev_brake_bias = self.prev_diff_slip = 5
         self.current_risk_level: Optional[str] = None
         self.voice_announcer = VoiceAnnouncer(enabled=voice_enabled)
+        # Bytes queued in the WebSocket transport above which laps are dropped (latest wins).
+        # Read at construction, not import, so a value from .env (loaded in main) is honoured
+        self._backpressure_limit = int(os.getenv("BACKPRESSURE_LIMIT", 256 * 1024))
+        # Shared HTTP session for enrichment calls (opened in stream_telemetry)
+        self._http: Optional[aiohttp.ClientSession] = None
+        # Outbound WebSocket messages, drained by _sender (created per connection)
+        self._out_q: Optional[asyncio.Queue] = None
+        # Set while the AI layer is not keeping up; cleared once the buffer drains
+        self._backpressured = False
+        # In-flight announcements, so they can be drained before shutdown
+        self._voice_tasks: set = set()
     
     def load_lap_csv(self) -> pd.DataFrame:
         """Load lap-level CSV data."""
+        import pandas as pd
+        
         logger.info(f"Loading CSV from {self.csv_path}")
-        df = pd.read_csv(self.csv_path)
+        df = pd.read_csv(self.csv_path, dtype=_LAP_CSV_DTYPES, engine="c")
         logger.info(f"Loaded {len(df)} laps")
+        
+        # Fill missing race-position data once so per-lap payloads need no NaN checks
+        df["position"] = df["position"].fillna(10).astype("int32")
+        df["gap_to_leader"] = df["gap_to_leader"].fillna(0.0)
+        df["gap_to_ahead"] = df["gap_to_ahead"].fillna(0.0)
+        
         return df
     
-    def lap_to_raw_payload(self, row: pd.Series) -> Dict[str, Any]:
+    def lap_to_raw_payload(self, lap: Any) -> Dict[str, Any]:
         """
-        Convert CSV row to raw lap telemetry (for enrichment service).
+        Convert CSV row (itertuples record) to raw lap telemetry (for enrichment service).
         This is what the real Pi would send.
         """
         return {
-            "lap_number": int(row["lap_number"]),
-            "total_laps": int(row["total_laps"]),
-            "position": int(row["position"]) if pd.notna(row["position"]) else 10,
-            "gap_to_leader": float(row["gap_to_leader"]) if pd.notna(row["gap_to_leader"]) else 0.0,
-            "gap_to_ahead": float(row["gap_to_ahead"]) if pd.notna(row["gap_to_ahead"]) else 0.0,
-            "lap_time": str(row["lap_time"]),
-            "average_speed": float(row["average_speed"]),
-            "max_speed": float(row["max_speed"]),
-            "tire_compound": str(row["tire_compound"]),
-            "tire_life_laps": int(row["tire_life_laps"]),
-            "track_temperature": float(row["track_temperature"]),
-            "rainfall": bool(row.get("rainfall", False))
+            "lap_number": int(lap.lap_number),
+            "total_laps": int(lap.total_laps),
+            "position": int(lap.position),
+            "gap_to_leader": float(lap.gap_to_leader),
+            "gap_to_ahead": float(lap.gap_to_ahead),
+            "lap_time": lap.lap_time,  # already str (object dtype)
+            "average_speed": float(lap.average_speed),
+            "max_speed": float(lap.max_speed),
+            "tire_compound": str(lap.tire_compound),
+            "tire_life_laps": int(lap.tire_life_laps),
+            "track_temperature": float(lap.track_temperature),
+            "rainfall": bool(getattr(lap, "rainfall", False))
         }
     
-    async def enrich_telemetry(self, raw_telemetry: Dict[str, Any]) -> Dict[str, Any]:
+    async def enrich_telemetry(self, lap_number: int, body: str) -> Dict[str, Any]:
         """
         Send raw telemetry to enrichment service and get back enriched data.
         This simulates the Pi → Enrichment → AI flow.
-        """
-        import aiohttp
         
+        Args:
+            lap_number: Lap the telemetry belongs to (for logging)
+            body: Raw telemetry already serialized to JSON (see lap_to_raw_payload)
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.enrichment_url}/ingest/telemetry",
-                    json=raw_telemetry,
-                    timeout=aiohttp.ClientTimeout(total=5.0)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"  ✓ Enrichment service processed lap {raw_telemetry['lap_number']}")
-                        return result
-                    else:
-                        logger.error(f"  ✗ Enrichment service error: {response.status}")
-                        return None
+            async with self._http.post(
+                f"{self.enrichment_url}/ingest/telemetry",
+                data=body,
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status == 200:
+                    result = await response.json(loads=_loads)
+                    logger.info(f"  ✓ Enrichment service processed lap {lap_number}")
+                    return result
+                else:
+                    logger.error(f"  ✗ Enrichment service error: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"  ✗ Failed to connect to enrichment service: {e}")
             logger.error(f"  Make sure enrichment service is running: python scripts/serve.py")
             return None
     
-    def lap_to_enriched_payload(self, row: pd.Series) -> Dict[str, Any]:
-        """
-        Convert CSV row to enriched telemetry payload.
-        Simulates the enrichment layer output.
-        """
-        # Basic enrichment simulation (would normally come from enrichment service)
-        lap_number = int(row["lap_number"])
-        tire_age = int(row["tire_life_laps"])
-        
-        # Simple tire degradation simulation
-        tire_deg_rate = min(1.0, 0.02 * tire_age)
-        tire_cliff_risk = max(0.0, min(1.0, (tire_age - 20) / 10.0))
-        
-        # Pace trend (simplified)
-        pace_trend = "stable"
-        if tire_age > 25:
-            pace_trend = "declining"
-        elif tire_age < 5:
-            pace_trend = "improving"
-        
-        # Optimal pit window
-        if tire_age > 20:
-            pit_window = [lap_number + 1, lap_number + 3]
-        else:
-            pit_window = [lap_number + 10, lap_number + 15]
-        
-        # Performance delta (random for simulation)
-        import random
-        performance_delta = random.uniform(-1.5, 1.0)
-        
-        enriched_telemetry = {
-            "lap": lap_number,
-            "tire_degradation_rate": round(tire_deg_rate, 3),
-            "pace_trend": pace_trend,
-            "tire_cliff_risk": round(tire_cliff_risk, 3),
-            "optimal_pit_window": pit_window,
-            "performance_delta": round(performance_delta, 2)
-        }
-        
-        race_context = {
-            "race_info": {
-                "track_name": "Monza",
-                "total_laps": int(row["total_laps"]),
-                "current_lap": lap_number,
-                "weather_condition": "Wet" if row.get("rainfall", False) else "Dry",
-                "track_temp_celsius": float(row["track_temperature"])
-            },
-            "driver_state": {
-                "driver_name": "Alonso",
-                "current_position": 5,
-                "current_tire_compound": str(row["tire_compound"]).lower(),
-                "tire_age_laps": tire_age,
-                "fuel_remaining_percent": max(0.0, 100.0 * (1.0 - (lap_number / int(row["total_laps"]))))
-            },
-            "competitors": []
-        }
-        
-        return {
-            "type": "telemetry",
-            "lap_number": lap_number,
-            "enriched_telemetry": enriched_telemetry,
-            "race_context": race_context
-        }
-    
     async def stream_telemetry(self):
         """Main WebSocket streaming loop."""
-        self.df = self.load_lap_csv()
-        
-        # Reset enrichment service state for fresh session
+        # One pooled session for the whole race so every enrichment POST
+        # reuses a keep-alive connection instead of a fresh handshake
+        async with aiohttp.ClientSession(
+            # Keep idle sockets for longer than the default 60s lap interval
+            connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=90),
+            timeout=aiohttp.ClientTimeout(total=5.0)
+        ) as self._http:
+            try:
+                await self._stream_laps()
+            finally:
+                self._http = None
+                # Let announcements already under way finish before tearing down
+                if self._voice_tasks:
+                    await asyncio.gather(*self._voice_tasks, return_exceptions=True)
+    
+    def _announce_in_background(self, announcement):
+        """Run a voice announcement without holding up the lap loop."""
+        task = asyncio.create_task(announcement)
+        self._voice_tasks.add(task)
+        task.add_done_callback(self._voice_tasks.discard)
+    
+    async def _reset_enrichment(self):
+        """Reset enrichment service state for a fresh session."""
         logger.info(f"Resetting enrichment service state...")
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.enrichment_url}/reset",
-                    timeout=aiohttp.ClientTimeout(total=5.0)
-                ) as response:
-                    if response.status == 200:
-                        logger.info("✓ Enrichment service reset successfully")
-                    else:
-                        logger.warning(f"⚠ Enrichment reset returned status {response.status}")
+            async with self._http.post(f"{self.enrichment_url}/reset") as response:
+                if response.status == 200:
+                    logger.info("✓ Enrichment service reset successfully")
+                else:
+                    logger.warning(f"⚠ Enrichment reset returned status {response.status}")
         except Exception as e:
             logger.warning(f"⚠ Could not reset enrichment service: {e}")
             logger.warning("  Continuing anyway (enricher may have stale state)")
+    
+    async def _sender(self, websocket: WebSocketClientProtocol):
+        """Drain the outbound queue onto the socket until the None sentinel.
+        
+        Each message stays its own text frame: the AI layer reads exactly one
+        JSON object per frame, so queued payloads are never merged.
+        """
+        while True:
+            message = await self._out_q.get()
+            if message is None:
+                return
+            await websocket.send(message)
+    
+    def _under_backpressure(self, websocket: WebSocketClientProtocol) -> bool:
+        """
+        Whether the AI layer has fallen behind on reading our frames.
+        
+        Enters above _backpressure_limit buffered bytes (or a full out-queue)
+        and only leaves once the transport buffer has fully drained.
+        """
+        buffered = websocket.transport.get_write_buffer_size()
+        if buffered > self._backpressure_limit or self._out_q.full():
+            self._backpressured = True
+        elif buffered == 0 and self._out_q.empty():
+            self._backpressured = False
+        return self._backpressured
+    
+    async def _stream_laps(self):
+        """Reset enrichment state, connect to the AI layer and stream every lap."""
+        self.df = self.load_lap_csv()
+        
+        # Reset runs alongside the WebSocket handshake; both finish before lap 1
+        reset_task = asyncio.create_task(self._reset_enrichment())
+        sender_task: Optional[asyncio.Task] = None
+        # Enrichment of the next lap runs during the current lap's interval wait
+        prefetch: Optional[asyncio.Task] = None
         
         logger.info(f"Connecting to WebSocket: {self.ws_url}")
         
@@ -469,32 +616,62 @@ class PiSimulator:
                 self.ws_url,
                 ping_interval=20,  # Send ping every 20 seconds
                 ping_timeout=60,   # Wait up to 60 seconds for pong response
-                close_timeout=10   # Timeout for close handshake
+                close_timeout=10,  # Timeout for close handshake
+                compression=None,  # Frames are small JSON; deflate costs more than it saves
+                max_size=2**20,    # Control commands are tiny; cap inbound frames at 1 MiB
+                max_queue=8,       # Few unread inbound messages before the AI layer's sends stall
+                read_limit=2**16,  # Keep socket read/write buffers small so a slow peer
+                write_limit=2**16  # surfaces as backpressure instead of growing memory
             ) as websocket:
                 logger.info("WebSocket connected!")
                 
-                # Wait for welcome message
-                welcome = await websocket.recv()
+                # Sends go through a queue so the lap loop never blocks on socket writes
+                self._out_q = asyncio.Queue(maxsize=32)
+                sender_task = asyncio.create_task(self._sender(websocket))
+                
+                # Wait for welcome message (and the enrichment reset)
+                welcome, _ = await asyncio.gather(websocket.recv(), reset_task)
                 logger.info(f"Received: {welcome}")
                 
                 # Stream each lap
-                for idx, row in self.df.iterrows():
-                    lap_number = int(row["lap_number"])
+                rows = list(self.df.itertuples(index=False, name="Lap"))
+                # Raw telemetry (what the real Pi would send) serialized once for the whole race
+                raw_bodies = [_dumps(self.lap_to_raw_payload(lap)) for lap in rows]
+                # One envelope for every lap; only the per-lap fields change before each dump
+                ws_payload = {
+                    "type": "telemetry",
+                    "lap_number": None,
+                    "enriched_telemetry": None,
+                    "race_context": None
+                }
+                # Laps run on a fixed cadence: each is due one interval after the
+                # previous deadline, so time spent enriching and waiting on the AI
+                # layer comes out of the interval instead of adding to it
+                next_deadline = time.monotonic()
+                for idx, lap in enumerate(rows):
+                    # A dead sender would leave laps queueing up unsent; raise its error instead
+                    if sender_task.done():
+                        sender_task.result()
                     
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"Lap {lap_number}/{int(row['total_laps'])}")
-                    logger.info(f"{'='*60}")
+                    # A lap that overran its slot resets the schedule rather than
+                    # firing the following laps back-to-back to catch up
+                    next_deadline = max(next_deadline, time.monotonic()) + self.interval
+                    lap_number = int(lap.lap_number)
                     
-                    # Build raw telemetry payload (what real Pi would send)
-                    raw_telemetry = self.lap_to_raw_payload(row)
-                    logger.info(f"[RAW] Lap {lap_number} telemetry prepared")
+                    logger.debug(f"\n{'='*60}\nLap {lap_number}/{int(lap.total_laps)}\n{'='*60}")
                     
-                    # Send to enrichment service for processing
-                    enriched_data = await self.enrich_telemetry(raw_telemetry)
+                    if prefetch is not None:
+                        # Already sent to enrichment service during the previous lap
+                        enriched_data = await prefetch
+                        prefetch = None
+                    else:
+                        # Send to enrichment service for processing
+                        enriched_data = await self.enrich_telemetry(lap_number, raw_bodies[idx])
                     
                     if not enriched_data:
                         logger.error("Failed to get enrichment, skipping lap")
-                        await asyncio.sleep(self.interval)
+                        # The failed request already used part of this lap's interval
+                        await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
                         continue
                     
                     # Extract enriched telemetry and race context from enrichment service
@@ -503,25 +680,28 @@ class PiSimulator:
                     
                     if not enriched_telemetry or not race_context:
                         logger.error("Invalid enrichment response, skipping lap")
-                        await asyncio.sleep(self.interval)
+                        await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
                         continue
                     
-                    # Build WebSocket payload for AI layer
-                    ws_payload = {
-                        "type": "telemetry",
-                        "lap_number": lap_number,
-                        "enriched_telemetry": enriched_telemetry,
-                        "race_context": race_context
-                    }
+                    # Fill WebSocket payload for AI layer
+                    ws_payload["lap_number"] = lap_number
+                    ws_payload["enriched_telemetry"] = enriched_telemetry
+                    ws_payload["race_context"] = race_context
+                    
+                    # Telemetry is latest-wins: drop this lap rather than pile onto a slow consumer
+                    if self._under_backpressure(websocket):
+                        logger.warning(f"[BACKPRESSURE] AI layer not keeping up, skipping lap {lap_number}")
+                        await asyncio.sleep(max(0.0, next_deadline - time.monotonic()))
+                        continue
                     
                     # Send enriched telemetry to AI layer via WebSocket
-                    await websocket.send(json.dumps(ws_payload))
+                    await self._out_q.put(_dumps(ws_payload))
                     logger.info(f"[SENT] Lap {lap_number} enriched telemetry to AI layer")
                     
                     # Wait for control command response(s)
                     try:
                         response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                        response_data = json.loads(response)
+                        response_data = _loads(response)
                         
                         # Handle silent acknowledgment (no control update, no voice)
                         if response_data.get("type") == "acknowledgment":
@@ -532,65 +712,26 @@ class PiSimulator:
                             # Keep receiving messages until we get the update (ignoring keepalives)
                             try:
                                 timeout_remaining = 45.0
-                                start_time = asyncio.get_event_loop().time()
+                                start_time = asyncio.get_running_loop().time()
                                 
                                 while timeout_remaining > 0:
                                     update = await asyncio.wait_for(websocket.recv(), timeout=timeout_remaining)
-                                    update_data = json.loads(update)
+                                    update_data = _loads(update)
                                     
                                     # Ignore keepalive messages
                                     if update_data.get("type") == "keepalive":
                                         logger.debug(f"[KEEPALIVE] Received ping from server during strategy generation")
-                                        elapsed = asyncio.get_event_loop().time() - start_time
+                                        elapsed = asyncio.get_running_loop().time() - start_time
                                         timeout_remaining = 45.0 - elapsed
                                         continue
                                     
                                     # Process control command update
                                     if update_data.get("type") == "control_command_update":
-                                        brake_bias = update_data.get("brake_bias", 5)
-                                        diff_slip = update_data.get("differential_slip", 5)
-                                        strategy_name = update_data.get("strategy_name", "N/A")
-                                        risk_level = update_data.get("risk_level", "medium")
-                                        reasoning = update_data.get("reasoning", "")
-                                        
-                                        # Check if controls changed from previous
-                                        controls_changed = (
-                                            self.current_controls["brake_bias"] != brake_bias or
-                                            self.current_controls["differential_slip"] != diff_slip
-                                        )
-                                        
-                                        # Check if risk level changed
-                                        risk_level_changed = (
-                                            self.current_risk_level is not None and
-                                            self.current_risk_level != risk_level
-                                        )
-                                        
-                                        self.previous_controls = self.current_controls.copy()
-                                        self.current_controls["brake_bias"] = brake_bias
-                                        self.current_controls["differential_slip"] = diff_slip
-                                        self.current_risk_level = risk_level
-                                        
-                                        logger.info(f"[UPDATED] Strategy-Based Control:")
-                                        logger.info(f"  ├─ Brake Bias: {brake_bias}/10")
-                                        logger.info(f"  ├─ Differential Slip: {diff_slip}/10")
-                                        logger.info(f"  ├─ Strategy: {strategy_name}")
-                                        logger.info(f"  ├─ Risk Level: {risk_level}")
-                                        if reasoning:
-                                            logger.info(f"  └─ Reasoning: {reasoning[:100]}...")
-                                        
-                                        self.apply_controls(brake_bias, diff_slip)
-                                        
-                                        # Voice announcement if controls OR risk level changed
-                                        if controls_changed or risk_level_changed:
-                                            if risk_level_changed and not controls_changed:
-                                                logger.info(f"[VOICE] Risk level changed to {risk_level}")
-                                            await self.voice_announcer.announce_strategy(update_data)
-                                        else:
-                                            logger.info(f"[VOICE] Skipping announcement - controls and risk level unchanged")
+                                        await self._apply_update(lap_number, update_data)
                                         break  # Exit loop after processing update
                                     
                                     # Update timeout
-                                    elapsed = asyncio.get_event_loop().time() - start_time
+                                    elapsed = asyncio.get_running_loop().time() - start_time
                                     timeout_remaining = 45.0 - elapsed
                                     
                             except asyncio.TimeoutError:
@@ -604,77 +745,39 @@ class PiSimulator:
                             
                             # Store previous values before updating
                             controls_changed = (
-                                self.current_controls["brake_bias"] != brake_bias or
-                                self.current_controls["differential_slip"] != diff_slip
+                                self.brake_bias != brake_bias or
+                                self.diff_slip != diff_slip
                             )
                             
-                            self.previous_controls = self.current_controls.copy()
-                            self.current_controls["brake_bias"] = brake_bias
-                            self.current_controls["differential_slip"] = diff_slip
+                            self.prev_brake_bias, self.prev_diff_slip = self.brake_bias, self.diff_slip
+                            self.brake_bias = brake_bias
+                            self.diff_slip = diff_slip
                             
-                            logger.info(f"[RECEIVED] Control Command:")
-                            logger.info(f"  ├─ Brake Bias: {brake_bias}/10")
-                            logger.info(f"  ├─ Differential Slip: {diff_slip}/10")
-                            if strategy_name != "N/A":
-                                logger.info(f"  └─ Strategy: {strategy_name}")
-                            if message:
-                                logger.info(f"  └─ {message}")
+                            logger.info(f"[RECEIVED] Lap {lap_number} control command")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(
+                                    f"  ├─ Brake Bias: {brake_bias}/10\n"
+                                    f"  ├─ Differential Slip: {diff_slip}/10"
+                                    + (f"\n  └─ Strategy: {strategy_name}" if strategy_name != "N/A" else "")
+                                    + (f"\n  └─ {message}" if message else "")
+                                )
                             
                             # Apply controls (in real Pi, this would adjust hardware)
                             self.apply_controls(brake_bias, diff_slip)
                             
                             # Voice announcement ONLY if controls changed
                             if controls_changed:
-                                await self.voice_announcer.announce_control(response_data)
+                                self._announce_in_background(self.voice_announcer.announce_control(response_data))
                             
                             # If message indicates processing, wait for update
                             if message and "Processing" in message:
                                 logger.info("  AI is generating strategies, waiting for update...")
                                 try:
                                     update = await asyncio.wait_for(websocket.recv(), timeout=45.0)
-                                    update_data = json.loads(update)
+                                    update_data = _loads(update)
                                     
                                     if update_data.get("type") == "control_command_update":
-                                        brake_bias = update_data.get("brake_bias", 5)
-                                        diff_slip = update_data.get("differential_slip", 5)
-                                        strategy_name = update_data.get("strategy_name", "N/A")
-                                        risk_level = update_data.get("risk_level", "medium")
-                                        reasoning = update_data.get("reasoning", "")
-                                        
-                                        # Check if controls changed from previous
-                                        controls_changed = (
-                                            self.current_controls["brake_bias"] != brake_bias or
-                                            self.current_controls["differential_slip"] != diff_slip
-                                        )
-                                        
-                                        # Check if risk level changed
-                                        risk_level_changed = (
-                                            self.current_risk_level is not None and
-                                            self.current_risk_level != risk_level
-                                        )
-                                        
-                                        self.previous_controls = self.current_controls.copy()
-                                        self.current_controls["brake_bias"] = brake_bias
-                                        self.current_controls["differential_slip"] = diff_slip
-                                        self.current_risk_level = risk_level
-                                        
-                                        logger.info(f"[UPDATED] Strategy-Based Control:")
-                                        logger.info(f"  ├─ Brake Bias: {brake_bias}/10")
-                                        logger.info(f"  ├─ Differential Slip: {diff_slip}/10")
-                                        logger.info(f"  ├─ Strategy: {strategy_name}")
-                                        logger.info(f"  ├─ Risk Level: {risk_level}")
-                                        if reasoning:
-                                            logger.info(f"  └─ Reasoning: {reasoning[:100]}...")
-                                        
-                                        self.apply_controls(brake_bias, diff_slip)
-                                        
-                                        # Voice announcement if controls OR risk level changed
-                                        if controls_changed or risk_level_changed:
-                                            if risk_level_changed and not controls_changed:
-                                                logger.info(f"[VOICE] Risk level changed to {risk_level}")
-                                            await self.voice_announcer.announce_strategy(update_data)
-                                        else:
-                                            logger.info(f"[VOICE] Skipping announcement - controls and risk level unchanged")
+                                        await self._apply_update(lap_number, update_data)
                                 except asyncio.TimeoutError:
                                     logger.warning("[TIMEOUT] Strategy generation took too long")
                         
@@ -684,17 +787,30 @@ class PiSimulator:
                     except asyncio.TimeoutError:
                         logger.warning("[TIMEOUT] No control command received within 5s")
                     
+                    # Start enriching the next lap during the interval wait. Not before:
+                    # the enrichment service forwards each lap to the AI layer too, so
+                    # lap N+1 must not reach it until lap N's exchange is done
+                    if idx + 1 < len(rows):
+                        prefetch = asyncio.create_task(
+                            self.enrich_telemetry(int(rows[idx + 1].lap_number), raw_bodies[idx + 1])
+                        )
+                    
                     # Wait before next lap
-                    logger.info(f"Waiting {self.interval}s before next lap...")
-                    await asyncio.sleep(self.interval)
+                    delay = max(0.0, next_deadline - time.monotonic())
+                    logger.debug(f"Waiting {delay:.1f}s before next lap...")
+                    await asyncio.sleep(delay)
                 
                 # All laps complete
                 logger.info("\n" + "="*60)
                 logger.info("RACE COMPLETE - All laps streamed")
                 logger.info("="*60)
                 
-                # Send disconnect message
-                await websocket.send(json.dumps({"type": "disconnect"}))
+                # Send disconnect message, then let the sender flush and exit
+                if sender_task.done():
+                    sender_task.result()
+                await self._out_q.put(_DISCONNECT_FRAME)
+                await self._out_q.put(None)
+                await sender_task
         
         except websockets.exceptions.ConnectionClosedError as e:
             if e.code == 1011:
@@ -710,6 +826,61 @@ class PiSimulator:
             logger.error("Is the AI Intelligence Layer running on port 9000?")
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
+        finally:
+            if not reset_task.done():
+                reset_task.cancel()
+            if sender_task is not None and not sender_task.done():
+                sender_task.cancel()
+            # Don't leave an enrichment POST pending once the HTTP session closes
+            if prefetch is not None:
+                prefetch.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await prefetch
+    
+    async def _apply_update(self, lap_number: int, update_data: Dict[str, Any]) -> None:
+        """Apply a control_command_update and announce it if anything changed."""
+        brake_bias = update_data.get("brake_bias", 5)
+        diff_slip = update_data.get("differential_slip", 5)
+        strategy_name = update_data.get("strategy_name", "N/A")
+        risk_level = update_data.get("risk_level", "medium")
+        reasoning = update_data.get("reasoning", "")
+        
+        # Check if controls changed from previous
+        controls_changed = (
+            self.brake_bias != brake_bias or
+            self.diff_slip != diff_slip
+        )
+        
+        # Check if risk level changed
+        risk_level_changed = (
+            self.current_risk_level is not None and
+            self.current_risk_level != risk_level
+        )
+        
+        self.prev_brake_bias, self.prev_diff_slip = self.brake_bias, self.diff_slip
+        self.brake_bias = brake_bias
+        self.diff_slip = diff_slip
+        self.current_risk_level = risk_level
+        
+        logger.info(f"[UPDATED] Lap {lap_number} strategy '{strategy_name}' ({risk_level} risk)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"  ├─ Brake Bias: {brake_bias}/10\n"
+                f"  ├─ Differential Slip: {diff_slip}/10\n"
+                f"  ├─ Strategy: {strategy_name}\n"
+                f"  ├─ Risk Level: {risk_level}"
+                + (f"\n  └─ Reasoning: {reasoning[:100]}..." if reasoning else "")
+            )
+        
+        self.apply_controls(brake_bias, diff_slip)
+        
+        # Voice announcement if controls OR risk level changed
+        if controls_changed or risk_level_changed:
+            if risk_level_changed and not controls_changed:
+                logger.info(f"[VOICE] Risk level changed to {risk_level}")
+            self._announce_in_background(self.voice_announcer.announce_strategy(update_data))
+        else:
+            logger.info(f"[VOICE] Skipping announcement - controls and risk level unchanged")
     
     def apply_controls(self, brake_bias: int, differential_slip: int):
         """
@@ -726,18 +897,18 @@ class PiSimulator:
         
         # For simulation, just log the change
         if brake_bias > 6:
-            logger.info("  → Brake bias shifted REAR (protecting front tires)")
+            logger.debug("  → Brake bias shifted REAR (protecting front tires)")
         elif brake_bias < 5:
-            logger.info("  → Brake bias shifted FRONT (aggressive turn-in)")
+            logger.debug("  → Brake bias shifted FRONT (aggressive turn-in)")
         else:
-            logger.info("  → Brake bias NEUTRAL")
+            logger.debug("  → Brake bias NEUTRAL")
         
         if differential_slip > 6:
-            logger.info("  → Differential slip INCREASED (gentler on tires)")
+            logger.debug("  → Differential slip INCREASED (gentler on tires)")
         elif differential_slip < 5:
-            logger.info("  → Differential slip DECREASED (aggressive cornering)")
+            logger.debug("  → Differential slip DECREASED (aggressive cornering)")
         else:
-            logger.info("  → Differential slip NEUTRAL")
+            logger.debug("  → Differential slip NEUTRAL")
 
 
 async def main():
@@ -773,9 +944,21 @@ async def main():
         action="store_true",
         help="Enable voice announcements for strategy updates (requires elevenlabs and ELEVENLABS_API_KEY)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log per-lap headers and full control command details"
+    )
     
     args = parser.parse_args()
     
+    # Settings such as BACKPRESSURE_LIMIT may come from the root .env
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+    
     # Determine CSV path
     if args.csv:
         csv_path = Path(args.csv)
@@ -808,4 +991,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based event loop when installed (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,6 +4,10 @@ Example: Integrate voice feedback with AI strategy decisions
 
 from voice_service import RaceEngineerVoice
 from pathlib import Path
+from typing import Optional
+
+# One engineer (and ElevenLabs client) for every announcement
+_ENGINEER: Optional[RaceEngineerVoice] = None
 
 def announce_strategy_decision(decision: dict):
     """
@@ -12,7 +16,10 @@ def announce_strategy_decision(decision: dict):
     Args:
         decision: Dict with keys like 'action', 'tire_compound', 'lap'
     """
-    engineer = RaceEngineerVoice()
+    global _ENGINEER
+    if _ENGINEER is None:
+        _ENGINEER = RaceEngineerVoice()
+    engineer = _ENGINEER
     
     # Generate appropriate message
     if decision['action'] == 'pit':
@@ -5,17 +5,32 @@ Converts AI strategy recommendations to natural speech.
 """
 
 import os
+import shutil
 from pathlib import Path
+from typing import Optional
 from elevenlabs.client import ElevenLabs
-from elevenlabs import save
 from dotenv import load_dotenv
 
+# Synthesized clips keyed by content hash (shared with the Pi simulator's cache)
+from audio_cache import cache_key, cached_clip, write_clip
+
 load_dotenv()
 
+# Shared client, so every RaceEngineerVoice reuses one HTTP connection pool
+_CLIENT: Optional[ElevenLabs] = None
+
+
+def get_client() -> ElevenLabs:
+    """Process-wide ElevenLabs client (created on first use)."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+    return _CLIENT
+
 class RaceEngineerVoice:
     def __init__(self, voice_id: str = "mbBupyLcEivjpxh8Brkf"):
         
-        self.client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+        self.client = get_client()
         self.voice_id = voice_id
         
     def synthesize_strategy_message(
@@ -37,27 +52,40 @@ class RaceEngineerVoice:
         Returns:
             Path to generated audio file
         """
-        audio = self.client.text_to_speech.convert(
-            voice_id=self.voice_id,
-            text=text,
-            model_id="eleven_multilingual_v2",  # Fast, low-latency model
-            voice_settings={
-                "stability": stability,
-                "similarity_boost": similarity_boost,
-                "style": 0.7,
-                "use_speaker_boost": True
-            }
-        )
+        cached = self._render(text, stability, similarity_boost)
         
         # Save audio
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write the audio generator to file
-        save(audio, str(output_path))
+        if output_path.resolve() != cached.resolve():
+            shutil.copyfile(cached, output_path)
         
         return output_path
     
+    def _render(self, text: str, stability: float = 0.4, similarity_boost: float = 0.95) -> Path:
+        """Cached MP3 for the text and settings, calling ElevenLabs only on a miss."""
+        model_id = "eleven_multilingual_v2"
+        voice_settings = {
+            "stability": stability,
+            "similarity_boost": similarity_boost,
+            "style": 0.7,
+            "use_speaker_boost": True
+        }
+        key = cache_key(self.voice_id, model_id, voice_settings, text)
+        cached = cached_clip(key)
+        if cached is not None:
+            return cached
+        
+        audio = self.client.text_to_speech.convert(
+            voice_id=self.voice_id,
+            text=text,
+            model_id=model_id,
+            voice_settings=voice_settings
+        )
+        
+        # Written as chunks arrive (save() would buffer the whole clip first)
+        return write_clip(key, audio)
+    
     def race_engineer_commands(self) -> dict:
         """Common F1 race engineer commands"""
         return {
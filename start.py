@@ -3,97 +3,109 @@
 Startup supervisor for HPC Simulation Services.
 Manages both enrichment service and AI intelligence layer.
 """
-import subprocess
-import sys
-import time
+import asyncio
+import contextlib
 import signal
-import os
+import sys
 
 processes = []
 
-def cleanup(signum=None, frame=None):
+async def cleanup():
     """Clean up all child processes."""
     print("\n🛑 Shutting down all services...")
     for proc in processes:
+        if proc.returncode is not None:
+            continue
         try:
             proc.terminate()
-            proc.wait(timeout=5)
-        except subprocess.TimeoutExpired:
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except asyncio.TimeoutError:
             proc.kill()
+            await proc.wait()
+        except ProcessLookupError:
+            pass
         except Exception as e:
             print(f"Error stopping process: {e}")
-    sys.exit(0)
 
-# Register signal handlers
-signal.signal(signal.SIGINT, cleanup)
-signal.signal(signal.SIGTERM, cleanup)
+async def start_service(script: str, startup_wait: float, stop: asyncio.Event) -> bool:
+    """Launch a service and give it time to come up; False if it exited or we were stopped."""
+    # Children inherit our stdout/stderr, so their logs can never back up a pipe
+    proc = await asyncio.create_subprocess_exec(sys.executable, script)
+    processes.append(proc)
+    print(f"   ├─ PID: {proc.pid}")
+
+    # Give it time to start (returns early if the service exits or Ctrl+C arrives)
+    exited = asyncio.create_task(proc.wait())
+    stopped = asyncio.create_task(stop.wait())
+    await asyncio.wait({exited, stopped}, timeout=startup_wait, return_when=asyncio.FIRST_COMPLETED)
+    exited.cancel()
+    stopped.cancel()
+
+    return proc.returncode is None and not stop.is_set()
+
+async def main():
+    # Register signal handlers
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C surfaces as KeyboardInterrupt instead
 
-def main():
     print("🚀 Starting HPC Simulation Services...")
-    
+
     # Start enrichment service
     print("📊 Starting Enrichment Service on port 8000...")
-    enrichment_proc = subprocess.Popen(
-        [sys.executable, "scripts/serve.py"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
-    )
-    processes.append(enrichment_proc)
-    print(f"   ├─ PID: {enrichment_proc.pid}")
-    
-    # Give it time to start
-    time.sleep(5)
-    
-    # Check if still running
-    if enrichment_proc.poll() is not None:
-        print("❌ Enrichment service failed to start")
-        cleanup()
-        return 1
+    if not await start_service("scripts/serve.py", 5, stop):
+        if not stop.is_set():
+            print("❌ Enrichment service failed to start")
+        await cleanup()
+        return 0 if stop.is_set() else 1
     print("   └─ ✅ Enrichment service started successfully")
-    
+
     # Start AI Intelligence Layer
     print("🤖 Starting AI Intelligence Layer on port 9000...")
-    ai_proc = subprocess.Popen(
-        [sys.executable, "ai_intelligence_layer/main.py"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
-    )
-    processes.append(ai_proc)
-    print(f"   ├─ PID: {ai_proc.pid}")
-    
-    # Give it time to start
-    time.sleep(3)
-    
-    # Check if still running
-    if ai_proc.poll() is not None:
-        print("❌ AI Intelligence Layer failed to start")
-        cleanup()
-        return 1
+    if not await start_service("ai_intelligence_layer/main.py", 3, stop):
+        if not stop.is_set():
+            print("❌ AI Intelligence Layer failed to start")
+        await cleanup()
+        return 0 if stop.is_set() else 1
     print("   └─ ✅ AI Intelligence Layer started successfully")
-    
+
     print("\n✨ All services running!")
     print("   📊 Enrichment Service: http://0.0.0.0:8000")
     print("   🤖 AI Intelligence Layer: ws://0.0.0.0:9000/ws/pi")
     print("\nPress Ctrl+C to stop all services\n")
-    
-    # Monitor processes
-    try:
-        while True:
-            # Check if any process has died
-            for proc in processes:
-                if proc.poll() is not None:
-                    print(f"⚠️  Process {proc.pid} died unexpectedly!")
-                    cleanup()
-                    return 1
-            time.sleep(1)
-    except KeyboardInterrupt:
-        cleanup()
-    
+
+    # Monitor processes: sleep until a child exits or a shutdown signal arrives
+    waiters = {asyncio.create_task(proc.wait()): proc for proc in processes}
+    stopped = asyncio.create_task(stop.wait())
+    done, pending = await asyncio.wait({*waiters, stopped}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+
+    # Check if any process has died. Ctrl+C also sends SIGINT to the children,
+    # so one may exit just before our own handler runs; that is a shutdown, not a crash
+    died = [waiters[task] for task in done if task in waiters]
+    if died and not stop.is_set():
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop.wait(), timeout=0.5)
+    if died and not stop.is_set():
+        print(f"⚠️  Process {died[0].pid} died unexpectedly!")
+        await cleanup()
+        return 1
+
+    await cleanup()
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        sys.exit(asyncio.run(main()))
+    except KeyboardInterrupt:
+        # Only reached where signal handlers are unsupported (Windows)
+        print("\n🛑 Shutting down all services...")
+        for proc in processes:
+            if proc.returncode is None:
+                proc.terminate()
+        sys.exit(0)
@@ -3,13 +3,19 @@ Quick test to verify the complete integration workflow.
 Run this after starting both services to test end-to-end.
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
-import time
 
 
 def test_complete_workflow():
     """Test the complete workflow from raw telemetry to strategy generation."""
-    
+    # One pooled session so every request reuses a keep-alive connection per service
+    with requests.Session() as session:
+        session.mount("http://localhost", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        return _run_workflow(session)
+
+
+def _run_workflow(session: requests.Session):
     print("🧪 Testing Complete Integration Workflow\n")
     print("=" * 70)
     
@@ -17,7 +23,7 @@ def test_complete_workflow():
     print("\n1️⃣  Checking service health...")
     
     try:
-        enrichment_health = requests.get("http://localhost:8000/healthz", timeout=2)
+        enrichment_health = session.get("http://localhost:8000/healthz", timeout=2)
         print(f"   ✅ Enrichment service: {enrichment_health.json()}")
     except Exception as e:
         print(f"   ❌ Enrichment service not responding: {e}")
@@ -25,7 +31,7 @@ def test_complete_workflow():
         return False
     
     try:
-        ai_health = requests.get("http://localhost:9000/api/health", timeout=2)
+        ai_health = session.get("http://localhost:9000/api/health", timeout=2)
         print(f"   ✅ AI Intelligence Layer: {ai_health.json()}")
     except Exception as e:
         print(f"   ❌ AI Intelligence Layer not responding: {e}")
@@ -54,10 +60,12 @@ def test_complete_workflow():
         }
         telemetry_samples.append(sample)
     
+    # Laps go one after another: the enricher is stateful, so lap N must land before N+1.
+    # Each POST already waits for enrichment (and the forward to the AI layer) to finish.
     responses = []
     for i, sample in enumerate(telemetry_samples, 1):
         try:
-            response = requests.post(
+            response = session.post(
                 "http://localhost:8000/ingest/telemetry",
                 json=sample,
                 timeout=5
@@ -91,8 +99,6 @@ def test_complete_workflow():
                 print(f"   Lap {sample['lap_number']}: ❌ Failed ({response.status_code})")
         except Exception as e:
             print(f"   Lap {sample['lap_number']}: ❌ Error: {e}")
-        
-        time.sleep(0.5)  # Small delay between requests
     
     # Test 3: Check AI layer buffer
     print("\n3️⃣  Checking AI layer webhook processing...")
@@ -129,7 +135,7 @@ def test_complete_workflow():
             }
         }
         
-        response = requests.post(
+        response = session.post(
             "http://localhost:9000/api/strategy/brainstorm",
             json=brainstorm_request,
             timeout=30
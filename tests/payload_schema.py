@@ -0,0 +1,46 @@
+"""
+JSON Schema for the enrich_with_context() payload checked by the integration
+tests and validate_integration.py.
+
+This is the field set those checks assert on (aero_efficiency, required
+competitors, ...). It is not the AI layer's EnrichedTelemetryWithContext
+model in ai_intelligence_layer/models/input_models.py, which uses different
+enriched-telemetry fields and treats competitors as optional.
+"""
+from jsonschema import Draft202012Validator
+
+ENRICHED_SCHEMA = {
+    'type': 'object',
+    'required': ['lap', 'aero_efficiency', 'tire_degradation_index',
+                 'ers_charge', 'fuel_optimization_score',
+                 'driver_consistency', 'weather_impact'],
+}
+
+RACE_CTX_SCHEMA = {
+    'type': 'object',
+    'required': ['race_info', 'driver_state', 'competitors'],
+    'properties': {
+        'race_info': {
+            'type': 'object',
+            'required': ['track_name', 'total_laps', 'current_lap',
+                         'weather_condition', 'track_temp_celsius'],
+        },
+        'driver_state': {
+            'type': 'object',
+            'required': ['driver_name', 'current_position',
+                         'current_tire_compound', 'tire_age_laps',
+                         'fuel_remaining_percent'],
+        },
+        'competitors': {'type': 'array'},
+    },
+}
+
+# Compiled once; reports every missing field in a single pass
+PAYLOAD_VALIDATOR = Draft202012Validator({
+    'type': 'object',
+    'required': ['enriched_telemetry', 'race_context'],
+    'properties': {
+        'enriched_telemetry': ENRICHED_SCHEMA,
+        'race_context': RACE_CTX_SCHEMA,
+    },
+})
@@ -6,8 +6,14 @@ from hpcsim.api import app
 
 
 class TestAPI(unittest.TestCase):
-    def setUp(self):
-        self.client = TestClient(app)
+    @classmethod
+    def setUpClass(cls):
+        # One client for the whole class; the app is stateless between these tests
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
 
     def test_ingest_and_list(self):
         payload = {
@@ -1,6 +1,10 @@
 """
 Integration test for enrichment + AI intelligence layer workflow.
 Tests the complete flow from raw telemetry to automatic strategy generation.
+
+The tests are independent and safe to run in parallel (e.g. `pytest -n auto`):
+Enricher keeps no class-level or module-level state, and each test builds
+its own Enricher.
 """
 import unittest
 from unittest.mock import patch, MagicMock
@@ -8,6 +12,7 @@ import json
 
 from hpcsim.enrichment import Enricher
 from hpcsim.adapter import normalize_telemetry
+from payload_schema import PAYLOAD_VALIDATOR
 
 
 class TestIntegration(unittest.TestCase):
@@ -121,37 +126,8 @@ class TestIntegration(unittest.TestCase):
         # which has enriched_telemetry and race_context
         
         # Verify it matches the expected schema
-        self.assertIn('enriched_telemetry', result)
-        self.assertIn('race_context', result)
-        
-        enriched_telem = result['enriched_telemetry']
-        race_ctx = result['race_context']
-        
-        # Verify enriched_telemetry matches EnrichedTelemetryWebhook schema
-        required_fields = ['lap', 'aero_efficiency', 'tire_degradation_index', 
-                          'ers_charge', 'fuel_optimization_score', 
-                          'driver_consistency', 'weather_impact']
-        for field in required_fields:
-            self.assertIn(field, enriched_telem, f"Missing field: {field}")
-        
-        # Verify race_context matches RaceContext schema
-        self.assertIn('race_info', race_ctx)
-        self.assertIn('driver_state', race_ctx)
-        self.assertIn('competitors', race_ctx)
-        
-        # Verify nested structures
-        race_info_fields = ['track_name', 'total_laps', 'current_lap', 
-                           'weather_condition', 'track_temp_celsius']
-        for field in race_info_fields:
-            self.assertIn(field, race_ctx['race_info'], 
-                         f"Missing race_info field: {field}")
-        
-        driver_state_fields = ['driver_name', 'current_position', 
-                              'current_tire_compound', 'tire_age_laps', 
-                              'fuel_remaining_percent']
-        for field in driver_state_fields:
-            self.assertIn(field, race_ctx['driver_state'], 
-                         f"Missing driver_state field: {field}")
+        errors = [e.message for e in PAYLOAD_VALIDATOR.iter_errors(result)]
+        self.assertEqual(errors, [], f"Schema errors: {errors}")
     
     def test_fuel_level_conversion(self):
         """Verify fuel level is correctly converted from 0-1 to 0-100."""
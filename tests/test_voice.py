@@ -5,6 +5,8 @@ Quick test script for ElevenLabs voice announcements.
 
 import sys
 import os
+import shutil
+import subprocess
 from pathlib import Path
 
 sys.path.insert(0, '.')
@@ -56,14 +58,19 @@ try:
     save(audio, str(output_path))
     print(f"✓ Audio saved to: {output_path}")
     
-    # Play audio
+    # Play audio (player runs on its own; no shell, so the path is never interpreted)
     print("✓ Playing audio...")
     if sys.platform == "darwin":  # macOS
-        os.system(f"afplay {output_path}")
+        subprocess.Popen(["afplay", str(output_path)])
     elif sys.platform == "linux":
-        os.system(f"mpg123 {output_path} || ffplay -nodisp -autoexit {output_path}")
+        if shutil.which("mpg123"):
+            subprocess.Popen(["mpg123", "-q", str(output_path)])
+        elif shutil.which("ffplay"):
+            subprocess.Popen(["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", str(output_path)])
+        else:
+            print("⚠ No audio player found (install mpg123 or ffmpeg)")
     elif sys.platform == "win32":
-        os.system(f"start {output_path}")
+        os.startfile(output_path)
     
     print("✓ Voice test completed successfully!")
     
@@ -4,17 +4,25 @@ Quick test to verify WebSocket control system.
 Tests the complete flow: Pi → AI → Control Commands
 """
 import asyncio
-import json
 import sys
 
 try:
+    import orjson
     import websockets
 except ImportError:
-    print("Error: websockets not installed")
-    print("Run: pip install websockets")
+    print("Error: orjson/websockets not installed")
+    print("Run: pip install orjson websockets")
     sys.exit(1)
 
 
+# Frames stay str: the AI layer reads text frames, so orjson's bytes are decoded
+def _dumps(obj):
+    return orjson.dumps(obj).decode()
+
+
+_loads = orjson.loads
+
+
 async def test_websocket():
     """Test WebSocket connection and control flow."""
     
@@ -28,103 +36,96 @@ async def test_websocket():
             
             # 1. Receive welcome message
             welcome = await websocket.recv()
-            welcome_data = json.loads(welcome)
+            welcome_data = _loads(welcome)
             print(f"✓ Welcome message: {welcome_data.get('message')}")
             
-            # 2. Send test telemetry (lap 1)
-            test_payload = {
-                "type": "telemetry",
-                "lap_number": 1,
-                "enriched_telemetry": {
-                    "lap": 1,
-                    "tire_degradation_rate": 0.15,
-                    "pace_trend": "stable",
-                    "tire_cliff_risk": 0.05,
-                    "optimal_pit_window": [25, 30],
-                    "performance_delta": 0.0
-                },
-                "race_context": {
-                    "race_info": {
-                        "track_name": "Monza",
-                        "total_laps": 51,
-                        "current_lap": 1,
-                        "weather_condition": "Dry",
-                        "track_temp_celsius": 28.0
-                    },
-                    "driver_state": {
-                        "driver_name": "Test Driver",
-                        "current_position": 5,
-                        "current_tire_compound": "medium",
-                        "tire_age_laps": 1,
-                        "fuel_remaining_percent": 98.0
+            # 2. Build test telemetry for laps 1-3
+            def make_frame(lap_num):
+                return _dumps({
+                    "type": "telemetry",
+                    "lap_number": lap_num,
+                    "enriched_telemetry": {
+                        "lap": lap_num,
+                        "tire_degradation_rate": 0.15,
+                        "pace_trend": "stable",
+                        "tire_cliff_risk": 0.05,
+                        "optimal_pit_window": [25, 30],
+                        "performance_delta": 0.0
                     },
-                    "competitors": []
-                }
-            }
+                    "race_context": {
+                        "race_info": {
+                            "track_name": "Monza",
+                            "total_laps": 51,
+                            "current_lap": lap_num,
+                            "weather_condition": "Dry",
+                            "track_temp_celsius": 28.0
+                        },
+                        "driver_state": {
+                            "driver_name": "Test Driver",
+                            "current_position": 5,
+                            "current_tire_compound": "medium",
+                            "tire_age_laps": 1,
+                            "fuel_remaining_percent": 98.0
+                        },
+                        "competitors": []
+                    }
+                })
             
-            print("\n→ Sending lap 1 telemetry...")
-            await websocket.send(json.dumps(test_payload))
+            # 3. Pipeline: send all laps up front while a receiver reads the replies.
+            # The AI layer handles frames in order, so replies still arrive as
+            # lap 1 command, lap 2 command, lap 3 ack, lap 3 strategy update.
+            async def sender():
+                for lap_num in [1, 2, 3]:
+                    print(f"\n→ Sending lap {lap_num} telemetry...")
+                    await websocket.send(make_frame(lap_num))
             
-            # 3. Wait for response (short timeout for first laps)
-            response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-            response_data = json.loads(response)
-            
-            if response_data.get("type") == "control_command":
-                print("✓ Received control command!")
-                print(f"  Brake Bias: {response_data.get('brake_bias')}/10")
-                print(f"  Differential Slip: {response_data.get('differential_slip')}/10")
-                print(f"  Message: {response_data.get('message', 'N/A')}")
-            else:
-                print(f"✗ Unexpected response: {response_data}")
-            
-            # 4. Send two more laps to trigger strategy generation
-            for lap_num in [2, 3]:
-                test_payload["lap_number"] = lap_num
-                test_payload["enriched_telemetry"]["lap"] = lap_num
-                test_payload["race_context"]["race_info"]["current_lap"] = lap_num
-                
-                print(f"\n→ Sending lap {lap_num} telemetry...")
-                await websocket.send(json.dumps(test_payload))
-                
-                # Lap 3 triggers Gemini, so expect two responses
-                if lap_num == 3:
-                    print(f"  (lap 3 will trigger strategy generation - may take 10-30s)")
+            async def receiver():
+                # One drain over every reply, dispatched on type until lap 3's
+                # strategy result (or an error) arrives
+                async for raw in websocket:
+                    response_data = _loads(raw)
+                    msg_type = response_data.get("type")
+                    
+                    if msg_type == "keepalive":
+                        continue
                     
-                    # First response: immediate acknowledgment
-                    response1 = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    response1_data = json.loads(response1)
-                    print(f"✓ Immediate response: {response1_data.get('message', 'Processing...')}")
+                    if msg_type == "control_command":
+                        # Laps 1-2: neutral controls while data is collected
+                        print(f"✓ Lap {response_data.get('lap')} control command received!")
+                        print(f"  Brake Bias: {response_data.get('brake_bias')}/10")
+                        print(f"  Differential Slip: {response_data.get('differential_slip')}/10")
+                        print(f"  Message: {response_data.get('message', 'N/A')}")
                     
-                    # Second response: strategy-based controls
-                    print("  Waiting for strategy generation to complete...")
-                    response2 = await asyncio.wait_for(websocket.recv(), timeout=45.0)
-                    response2_data = json.loads(response2)
+                    elif msg_type == "acknowledgment":
+                        # Lap 3 triggers Gemini: immediate acknowledgment first
+                        print(f"✓ Immediate response: {response_data.get('message', 'Processing...')}")
+                        print("  Waiting for strategy generation to complete (may take 10-30s)...")
                     
-                    if response2_data.get("type") == "control_command_update":
-                        print(f"✓ Lap {lap_num} strategy-based control received!")
-                        print(f"  Brake Bias: {response2_data.get('brake_bias')}/10")
-                        print(f"  Differential Slip: {response2_data.get('differential_slip')}/10")
+                    elif msg_type == "control_command_update":
+                        print(f"✓ Lap 3 strategy-based control received!")
+                        print(f"  Brake Bias: {response_data.get('brake_bias')}/10")
+                        print(f"  Differential Slip: {response_data.get('differential_slip')}/10")
                         
-                        strategy = response2_data.get('strategy_name')
+                        strategy = response_data.get('strategy_name')
                         if strategy and strategy != "N/A":
                             print(f"  Strategy: {strategy}")
-                            print(f"  Total Strategies: {response2_data.get('total_strategies')}")
+                            print(f"  Total Strategies: {response_data.get('total_strategies')}")
                             print("✓ Strategy generation successful!")
-                    else:
-                        print(f"✗ Unexpected response: {response2_data}")
-                else:
-                    # Laps 1-2: just one response
-                    response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    response_data = json.loads(response)
+                        return
                     
-                    if response_data.get("type") == "control_command":
-                        print(f"✓ Lap {lap_num} control command received!")
-                        print(f"  Brake Bias: {response_data.get('brake_bias')}/10")
-                        print(f"  Differential Slip: {response_data.get('differential_slip')}/10")
+                    else:
+                        print(f"✗ Unexpected response: {response_data}")
+                        if msg_type == "error":
+                            return
+                
+                raise RuntimeError("Connection closed before the strategy update arrived")
+            
+            # A single timeout covers the whole exchange, including strategy generation
+            await asyncio.wait_for(asyncio.gather(sender(), receiver()), timeout=60.0)
             
-            # 5. Disconnect
+            # 4. Disconnect
             print("\n→ Sending disconnect...")
-            await websocket.send(json.dumps({"type": "disconnect"}))
+            await websocket.send(_dumps({"type": "disconnect"}))
             
             print("\n" + "=" * 60)
             print("✓ ALL TESTS PASSED!")
@@ -6,7 +6,23 @@ This shows that all pieces fit together correctly.
 
 from hpcsim.enrichment import Enricher
 from hpcsim.adapter import normalize_telemetry
-import json
+from tests.payload_schema import PAYLOAD_VALIDATOR
+import orjson
+import os
+
+
+def _pretty(obj):
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+# Dump full payloads only when asked (HPCSIM_VALIDATE_VERBOSE=1)
+VERBOSE = os.environ.get('HPCSIM_VALIDATE_VERBOSE', '0') == '1'
+
+
+def validate_structure(result):
+    """Check result against the payload schema, reporting every problem at once."""
+    errors = [e.message for e in PAYLOAD_VALIDATOR.iter_errors(result)]
+    assert not errors, "Schema errors: " + "; ".join(errors)
 
 
 def validate_task_1():
@@ -38,28 +54,14 @@ def validate_task_1():
     normalized = normalize_telemetry(raw_telemetry)
     result = enricher.enrich_with_context(normalized)
     
-    print("\n✅ Input to AI Layer (/api/ingest/enriched):")
-    print(json.dumps(result, indent=2))
+    if VERBOSE:
+        print("\n✅ Input to AI Layer (/api/ingest/enriched):")
+        print(_pretty(result))
     
     # Validate structure
-    assert 'enriched_telemetry' in result, "Missing enriched_telemetry"
-    assert 'race_context' in result, "Missing race_context"
-    
-    enriched = result['enriched_telemetry']
+    validate_structure(result)
     context = result['race_context']
     
-    # Validate enriched telemetry fields
-    required_enriched = ['lap', 'aero_efficiency', 'tire_degradation_index', 
-                        'ers_charge', 'fuel_optimization_score', 
-                        'driver_consistency', 'weather_impact']
-    for field in required_enriched:
-        assert field in enriched, f"Missing enriched field: {field}"
-    
-    # Validate race context structure
-    assert 'race_info' in context, "Missing race_info"
-    assert 'driver_state' in context, "Missing driver_state"
-    assert 'competitors' in context, "Missing competitors"
-    
     # Validate race_info
     race_info = context['race_info']
     assert race_info['track_name'] == 'Monza'
@@ -101,8 +103,9 @@ def validate_task_2():
     
     # Old method (legacy) - should still work
     legacy_result = enricher.enrich(minimal_input)
-    print("\n📊 Legacy Output (enrich method):")
-    print(json.dumps(legacy_result, indent=2))
+    if VERBOSE:
+        print("\n📊 Legacy Output (enrich method):")
+        print(_pretty(legacy_result))
     assert 'lap' in legacy_result
     assert 'aero_efficiency' in legacy_result
     assert 'race_context' not in legacy_result  # Legacy doesn't include context
@@ -126,12 +129,12 @@ def validate_task_2():
     }
     
     new_result = enricher.enrich_with_context(full_input)
-    print("\n📊 New Output (enrich_with_context method):")
-    print(json.dumps(new_result, indent=2))
+    if VERBOSE:
+        print("\n📊 New Output (enrich_with_context method):")
+        print(_pretty(new_result))
     
     # Validate new output
-    assert 'enriched_telemetry' in new_result
-    assert 'race_context' in new_result
+    validate_structure(new_result)
     
     enriched = new_result['enriched_telemetry']
     context = new_result['race_context']